@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Check that the charges of the structure are reasonable."""
+import os
 import warnings
 from tempfile import NamedTemporaryFile
 
@@ -8,6 +9,10 @@ import numpy as np
 from .check_base import AbstractCheck
 from ..types import StructureIStructureType
 
+# pyeqeq only reads from a file, so write it to a RAM-backed tmpfs if there is one.
+_SHM_DIR = "/dev/shm"
+_TMP_DIR = _SHM_DIR if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK) else None
+
 
 class ChargeCheck(AbstractCheck):
     """Check that the charges of the structure are reasonable."""
@@ -36,7 +41,7 @@ class ChargeCheck(AbstractCheck):
         try:
             from pyeqeq.main import run_on_cif
 
-            with NamedTemporaryFile("w", suffix=".cif") as file:
+            with NamedTemporaryFile("w", suffix=".cif", dir=_TMP_DIR) as file:
                 self.structure.to(fmt="cif", filename=file.name)
                 charges = run_on_cif(file.name, verbose=False)
                 has_high_charges = np.sum(np.abs(charges) > self.threshold)
@@ -3,7 +3,7 @@
 import abc
 from typing import List
 
-from functools import cached_property
+from ..utils import instance_cached_property
 
 
 class AbstractCheck(abc.ABC):
@@ -21,7 +21,7 @@ class AbstractCheck(abc.ABC):
         """Return the name of the check."""
         pass
 
-    @cached_property
+    @instance_cached_property
     def is_ok(self) -> bool:
         """Return whether the check passed."""
         return self._run_check()
@@ -46,19 +46,19 @@ class AbstractIndexCheck(abc.ABC):
         """Return the name of the check."""
         pass
 
-    @cached_property
+    @instance_cached_property
     def is_ok_and_indices(self):
         """Return whether the check passed and the indices that failed."""
         result, indices = self._run_check()
         return result, indices
 
-    @cached_property
+    @instance_cached_property
     def is_ok(self) -> bool:
         """Return whether the check passed."""
         result, _ = self.is_ok_and_indices
         return result
 
-    @cached_property
+    @instance_cached_property
     def flagged_indices(self) -> List[int]:
         """Return the indices that failed the check."""
         _, indices = self.is_ok_and_indices
@@ -84,7 +84,7 @@ class AbstractMissingCheck(abc.ABC):
         """Return the name of the check."""
         pass
 
-    @cached_property
+    @instance_cached_property
     def is_ok_indices_positions(self):
         """Return whether the check passed and the indices and positions that failed."""
         result, indices, positions = self._run_check()
@@ -100,3 +100,33 @@ METALS = (
     "Bi",
     "Po",
 )
+
+# Keys returned by MOFChecker.get_mof_descriptors(). Kept here, away from the
+# heavy pymatgen imports, so the list can be read without loading them.
+DESCRIPTORS = [
+    "name",
+    "graph_hash",
+    "undecorated_graph_hash",
+    "decorated_scaffold_hash",
+    "undecorated_scaffold_hash",
+    "symmetry_hash",
+    "formula",
+    "path",
+    "density",
+    "has_carbon",
+    "has_hydrogen",
+    "has_atomic_overlaps",
+    "has_overcoordinated_c",
+    "has_overcoordinated_n",
+    "has_overcoordinated_h",
+    "has_undercoordinated_c",
+    "has_undercoordinated_n",
+    "has_undercoordinated_rare_earth",
+    "has_metal",
+    "has_lone_molecule",
+    "has_high_charges",
+    "has_suspicicious_terminal_oxo",
+    "has_undercoordinated_alkali_alkaline",
+    "has_geometrically_exposed_metal",
+    "has_3d_connected_graph",
+]
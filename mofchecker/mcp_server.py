@@ -23,28 +23,120 @@ FeatherFlow config example (~/.featherflow/config.json):
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-import tempfile
+import multiprocessing
+import os
+import threading
 import traceback
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from mofchecker.definitions import DESCRIPTORS as _DESCRIPTORS
+
+
+def _dumps(obj) -> str:
+    """Serialise a tool response, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+# The descriptor list never changes while the server runs.
+_DESCRIPTORS_JSON = _dumps({"descriptors": _DESCRIPTORS})
+
 # Heavy dependencies (pymatgen, ase …) are loaded lazily on first tool call
 # so the MCP initialize handshake can complete before the import finishes.
+# The descriptor list lives in a plain constants module and needs none of them.
+# main() also starts the import in a background thread; the lock keeps that
+# warm-up and a concurrent first tool call from importing twice. Once the
+# import is done, _lazy_import is rebound to a no-op so tool calls skip the
+# check entirely.
 _MOFChecker = None
-_DESCRIPTORS = None
+_IMPORT_LOCK = threading.Lock()
+
+
+def _imported() -> None:
+    """Stand-in for _lazy_import once MOFChecker has been imported."""
 
 
 def _lazy_import() -> None:
-    """Import mofchecker on first use to avoid blocking MCP startup."""
-    global _MOFChecker, _DESCRIPTORS
-    if _MOFChecker is None:
-        from mofchecker import DESCRIPTORS as _D
-        from mofchecker import MOFChecker as _MC
-        _MOFChecker = _MC
-        _DESCRIPTORS = _D
+    """Import MOFChecker on first use to avoid blocking MCP startup."""
+    global _MOFChecker, _lazy_import
+    with _IMPORT_LOCK:
+        if _MOFChecker is None:
+            from mofchecker.checker import MOFChecker as _MC
+            _MOFChecker = _MC
+        _lazy_import = _imported
+
+
+class _LRUCache:
+    """Thread-safe LRU cache that computes each missing value only once.
+
+    Tools run in worker threads (see asyncio.to_thread below). When several
+    threads miss on the same key, the first one computes the value and the
+    others wait for its result instead of repeating the work.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._pending: dict = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, calling ``compute()`` on a miss."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+            future = self._pending.get(key)
+            owner = future is None
+            if owner:
+                future = self._pending[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            value = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            del self._pending[key]
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        future.set_result(value)
+        return value
+
+
+# Constructed checkers are reused across tool calls on the same structure, so
+# an agent calling the individual check tools one after another only pays for
+# CIF parsing and graph construction once.
+_CHECKER_CACHE = _LRUCache(maxsize=32)
+
+# EqEq charge results outlive checker evictions and are shared between inputs
+# that parse to the same structure (e.g. the same CIF sent as path and as
+# content). Keyed on a digest of the actual geometry (lattice, species and
+# fractional coordinates), since the charges change when an atom moves.
+_CHARGE_CACHE = _LRUCache(maxsize=256)
 
 # ---------------------------------------------------------------------------
 # Server instance
@@ -59,56 +151,287 @@ mcp = FastMCP(
     ),
 )
 
+# The structure tools are async and hand their work to asyncio.to_thread, so
+# a long check (e.g. EqEq charges) does not block the event loop: the server
+# keeps answering, can run calls on other structures concurrently and can
+# process cancellations. Check results are cached with a per-instance lock
+# (mofchecker.utils.instance_cached_property), so a slow check on one
+# structure does not hold up checks on another. list_available_descriptors
+# only returns a constant and stays sync.
+
 # ---------------------------------------------------------------------------
 # Helper
 # ---------------------------------------------------------------------------
 
 
-def _load_checker(
+def _structure_digest(structure) -> str:
+    """Return a digest of a structure's lattice, species and fractional coordinates."""
+    import numpy as np
+
+    digest = hashlib.blake2b(digest_size=16)
+    # Rounding absorbs float noise; adding 0.0 turns -0.0 into 0.0.
+    digest.update((np.round(structure.lattice.matrix, 6) + 0.0).tobytes())
+    digest.update(",".join(str(specie) for specie in structure.species).encode("utf-8"))
+    digest.update((np.round(structure.frac_coords % 1.0, 6) + 0.0).tobytes())
+    return digest.hexdigest()
+
+
+class _MemoChecker:
+    """Thin MOFChecker proxy that memoizes attribute access.
+
+    Several MOFChecker properties (graph hashes, spacegroup, symmetry) are
+    plain ``@property`` methods that redo their work on every access. Since
+    checkers are shared between tool calls, each value is computed once and
+    then served from ``_memo``.
+    """
+
+    def __init__(self, checker):
+        self._mc = checker
+        self._memo: dict = {}
+
+    def __getattr__(self, name: str):
+        try:
+            return self._memo[name]
+        except KeyError:
+            pass
+        value = getattr(self._mc, name)
+        if not callable(value):
+            self._memo[name] = value
+        return value
+
+    @property
+    def has_high_charges(self):
+        """Return the EqEq high-charge flag, reusing results for identical structures."""
+        if "has_high_charges" in self._memo:
+            return self._memo["has_high_charges"]
+        key = _structure_digest(self._mc.structure)
+        value = _CHARGE_CACHE.get_or_compute(key, lambda: self._mc.has_high_charges)
+        self._memo["has_high_charges"] = value
+        return value
+
+    def get_overlapping_indices(self):
+        """Return the (memoized) indices of overlapping atoms."""
+        if "overlapping_indices" not in self._memo:
+            self._memo["overlapping_indices"] = self._mc.get_overlapping_indices()
+        return self._memo["overlapping_indices"]
+
+    def get_mof_descriptors(self, descriptors=None) -> OrderedDict:
+        """Return the descriptors, resolving each one through the memo."""
+        if descriptors is None:
+            descriptors = _DESCRIPTORS
+        return OrderedDict((descriptor, getattr(self, descriptor)) for descriptor in descriptors)
+
+
+def _checker_cache_key(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+) -> Optional[tuple]:
+    """Return the cache key for a CIF input, or None if there is no input.
+
+    Also serves as input validation: a missing file raises here, before any
+    of the heavy imports are triggered.
+    """
+    if cif_path:
+        path = Path(cif_path)
+        if not path.is_file():
+            raise FileNotFoundError(f"CIF file not found: {cif_path}")
+        stat = path.stat()
+        return ("path", str(path.resolve()), stat.st_mtime, stat.st_size, primitive)
+    if cif_content and not cif_content.isspace():
+        digest = hashlib.blake2b(cif_content.encode("utf-8"), digest_size=16).hexdigest()
+        return ("content", digest, primitive)
+    return None
+
+
+def _build_checker(
     cif_path: Optional[str],
     cif_content: Optional[str],
     primitive: bool = False,
 ):
     """Instantiate MOFChecker from a file path or raw CIF text content."""
-    _lazy_import()
     if cif_path:
         return _MOFChecker.from_cif(cif_path, primitive=primitive)
-    if cif_content:
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".cif", delete=False, encoding="utf-8"
-        ) as tmp:
-            tmp.write(cif_content)
-            tmp_path = tmp.name
-        try:
-            checker = _MOFChecker.from_cif(tmp_path, primitive=primitive)
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
-        return checker
-    raise ValueError("Either cif_path or cif_content must be provided.")
+    # Parse the text in memory rather than round-tripping it through a
+    # temporary file; mirrors what MOFChecker.from_cif does for a path.
+    from pymatgen.io.cif import CifParser
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        structure = CifParser.from_str(cif_content).get_structures()[0]
+        return _MOFChecker(structure, primitive=primitive)
+
+
+def _load_checker(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool = False,
+):
+    """Return a (possibly cached) MOFChecker for a file path or raw CIF text."""
+    key = _checker_cache_key(cif_path, cif_content, primitive)
+    if key is None:
+        raise ValueError("Either cif_path or cif_content must be provided.")
+    _lazy_import()
+    return _CHECKER_CACHE.get_or_compute(
+        key, lambda: _MemoChecker(_build_checker(cif_path, cif_content, primitive))
+    )
 
 
 def _safe_list(iterable) -> list:
     """Convert an iterable of iterables to a JSON-serialisable list of lists."""
+    # numpy arrays (and rows of them) convert in C via tolist()
+    if hasattr(iterable, "tolist"):
+        return iterable.tolist()
     result = []
     for item in iterable:
-        try:
+        if hasattr(item, "tolist"):
+            result.append(item.tolist())
+        elif isinstance(item, (list, tuple)):
             result.append(list(item))
-        except TypeError:
-            result.append(item)
+        else:
+            try:
+                result.append(list(item))
+            except TypeError:
+                result.append(item)
     return result
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _coerce(value):
+    """Recursively convert a value into something ``_dumps`` accepts.
+
+    numpy arrays and scalars are converted through ``tolist()``; any other
+    unknown type falls back to its string representation.
+    """
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_coerce(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _coerce(item) for key, item in value.items()}
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+# Set MOFCHECKER_MCP_DEBUG=1 to include full tracebacks in error responses.
+_DEBUG = os.environ.get("MOFCHECKER_MCP_DEBUG") == "1"
+
+
+def _err_payload(tool: str, exc: Exception) -> dict:
+    payload = {"error": str(exc), "error_type": type(exc).__name__, "tool": tool}
+    if _DEBUG:
+        payload["detail"] = traceback.format_exc()
+    return payload
+
+
 def _err(tool: str, exc: Exception) -> str:
-    return json.dumps(
-        {"error": str(exc), "tool": tool, "detail": traceback.format_exc()},
-        ensure_ascii=False,
-    )
+    return _dumps(_err_payload(tool, exc))
 
 
 # ---------------------------------------------------------------------------
-# Tool 1 — meta
+# Result schemas
 # ---------------------------------------------------------------------------
 
+# Each tool's response is described by (output key, source) pairs, where the
+# source is either a checker attribute name or a function of the checker.
+
+
+def _candidate_positions(element: str):
+    """Return a getter for the H-addition positions of undercoordinated ``element``.
+
+    The has_undercoordinated_* flag is read once per call and comes from the
+    _MemoChecker memo, so a tool that also reports the flag itself (or
+    check_mof_full, via get_mof_descriptors) does not run the check again.
+    """
+    flag = f"has_undercoordinated_{element}"
+    positions = f"undercoordinated_{element}_candidate_positions"
+
+    def getter(mc) -> list:
+        has_missing = getattr(mc, flag)
+        return _safe_list(getattr(mc, positions)) if has_missing else []
+
+    return getter
+
+
+_uc_c_positions = _candidate_positions("c")
+_uc_n_positions = _candidate_positions("n")
+
+
+def _overlapping_indices(mc) -> list:
+    return mc.get_overlapping_indices()
+
+
+_BASIC_INFO_KEYS = (
+    ("name", "name"),
+    ("formula", "formula"),
+    ("density", "density"),
+    ("volume", "volume"),
+    ("graph_hash", "graph_hash"),
+    ("undecorated_graph_hash", "undecorated_graph_hash"),
+    ("decorated_scaffold_hash", "decorated_scaffold_hash"),
+    ("undecorated_scaffold_hash", "undecorated_scaffold_hash"),
+    ("symmetry_hash", "symmetry_hash"),
+    ("spacegroup_symbol", "spacegroup_symbol"),
+    ("spacegroup_number", "spacegroup_number"),
+)
+
+_GLOBAL_KEYS = (
+    ("has_metal", "has_metal"),
+    ("has_carbon", "has_carbon"),
+    ("has_hydrogen", "has_hydrogen"),
+    ("has_3d_connected_graph", "has_3d_connected_graph"),
+)
+
+_OVERLAP_KEYS = (
+    ("has_atomic_overlaps", "has_atomic_overlaps"),
+    ("overlapping_indices", _overlapping_indices),
+)
+
+_COORDINATION_KEYS = (
+    ("has_overcoordinated_c", "has_overcoordinated_c"),
+    ("overcoordinated_c_indices", "overvalent_c_indices"),
+    ("has_overcoordinated_n", "has_overcoordinated_n"),
+    ("has_overcoordinated_h", "has_overcoordinated_h"),
+    ("overcoordinated_h_indices", "overvalent_h_indices"),
+    ("has_undercoordinated_c", "has_undercoordinated_c"),
+    ("undercoordinated_c_indices", "undercoordinated_c_indices"),
+    ("undercoordinated_c_candidate_positions", _uc_c_positions),
+    ("has_undercoordinated_n", "has_undercoordinated_n"),
+    ("undercoordinated_n_indices", "undercoordinated_n_indices"),
+    ("undercoordinated_n_candidate_positions", _uc_n_positions),
+    ("has_undercoordinated_rare_earth", "has_undercoordinated_rare_earth"),
+    ("undercoordinated_rare_earth_indices", "undercoordinated_rare_earth_indices"),
+    ("has_undercoordinated_alkali_alkaline", "has_undercoordinated_alkali_alkaline"),
+    ("has_geometrically_exposed_metal", "has_geometrically_exposed_metal"),
+)
+
+_GEOMETRY_KEYS = (
+    ("has_suspicious_terminal_oxo", "has_suspicicious_terminal_oxo"),
+    ("suspicious_terminal_oxo_indices", "suspicicious_terminal_oxo_indices"),
+    ("has_lone_molecule", "has_lone_molecule"),
+    ("lone_molecule_indices", "lone_molecule_indices"),
+)
+
+_CHARGE_KEYS = (("has_high_charges", "has_high_charges"),)
+
+
+def _collect(mc, keys: tuple, fields: Optional[list] = None) -> dict:
+    """Build a tool result from a key schema, restricted to ``fields`` if given."""
+    if fields:
+        known = {key for key, _ in keys}
+        unknown = [f for f in fields if f not in known]
+        if unknown:
+            raise ValueError(f"Unknown field(s) {unknown}. Valid fields are {[key for key, _ in keys]}.")
+        keys = tuple((key, source) for key, source in keys if key in fields)
+    return {key: source(mc) if callable(source) else getattr(mc, source) for key, source in keys}
+
+
+# ---------------------------------------------------------------------------
+# Tool 1 — meta
+# ---------------------------------------------------------------------------
 
 @mcp.tool()
 def list_available_descriptors() -> str:
@@ -117,8 +440,7 @@ def list_available_descriptors() -> str:
     Returns a JSON object with key 'descriptors' containing the full list.
     No CIF file is required.
     """
-    _lazy_import()
-    return json.dumps({"descriptors": _DESCRIPTORS}, ensure_ascii=False)
+    return _DESCRIPTORS_JSON
 
 
 # ---------------------------------------------------------------------------
@@ -127,10 +449,11 @@ def list_available_descriptors() -> str:
 
 
 @mcp.tool()
-def get_basic_info(
+async def get_basic_info(
     cif_path: Optional[str] = None,
     cif_content: Optional[str] = None,
     primitive: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """Get basic structural information from a CIF file.
 
@@ -142,23 +465,20 @@ def get_basic_info(
         cif_path: Absolute path to the CIF file on the local filesystem.
         cif_content: Raw CIF file text content (used when cif_path is unavailable).
         primitive: If True, analyse the primitive cell instead of the as-read cell.
+        fields: Optional subset of the output keys to compute. Defaults to all.
     """
+    return await asyncio.to_thread(_sync_get_basic_info, cif_path, cif_content, primitive, fields)
+
+
+def _sync_get_basic_info(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
     try:
         mc = _load_checker(cif_path, cif_content, primitive)
-        result = {
-            "name": mc.name,
-            "formula": mc.formula,
-            "density": mc.density,
-            "volume": mc.volume,
-            "graph_hash": mc.graph_hash,
-            "undecorated_graph_hash": mc.undecorated_graph_hash,
-            "decorated_scaffold_hash": mc.decorated_scaffold_hash,
-            "undecorated_scaffold_hash": mc.undecorated_scaffold_hash,
-            "symmetry_hash": mc.symmetry_hash,
-            "spacegroup_symbol": mc.spacegroup_symbol,
-            "spacegroup_number": mc.spacegroup_number,
-        }
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(_collect(mc, _BASIC_INFO_KEYS, fields))
     except Exception as exc:
         return _err("get_basic_info", exc)
 
@@ -169,10 +489,11 @@ def get_basic_info(
 
 
 @mcp.tool()
-def check_global_structure(
+async def check_global_structure(
     cif_path: Optional[str] = None,
     cif_content: Optional[str] = None,
     primitive: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """Check global structural properties of a MOF.
 
@@ -183,16 +504,20 @@ def check_global_structure(
         cif_path: Absolute path to the CIF file.
         cif_content: Raw CIF file text content.
         primitive: If True, use the primitive cell.
+        fields: Optional subset of the output keys to compute. Defaults to all.
     """
+    return await asyncio.to_thread(_sync_check_global_structure, cif_path, cif_content, primitive, fields)
+
+
+def _sync_check_global_structure(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
     try:
         mc = _load_checker(cif_path, cif_content, primitive)
-        result = {
-            "has_metal": mc.has_metal,
-            "has_carbon": mc.has_carbon,
-            "has_hydrogen": mc.has_hydrogen,
-            "has_3d_connected_graph": mc.has_3d_connected_graph,
-        }
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(_collect(mc, _GLOBAL_KEYS, fields))
     except Exception as exc:
         return _err("check_global_structure", exc)
 
@@ -203,10 +528,11 @@ def check_global_structure(
 
 
 @mcp.tool()
-def check_atomic_overlaps(
+async def check_atomic_overlaps(
     cif_path: Optional[str] = None,
     cif_content: Optional[str] = None,
     primitive: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """Check for atomic overlaps (atoms placed unphysically close together).
 
@@ -216,14 +542,20 @@ def check_atomic_overlaps(
         cif_path: Absolute path to the CIF file.
         cif_content: Raw CIF file text content.
         primitive: If True, use the primitive cell.
+        fields: Optional subset of the output keys to compute. Defaults to all.
     """
+    return await asyncio.to_thread(_sync_check_atomic_overlaps, cif_path, cif_content, primitive, fields)
+
+
+def _sync_check_atomic_overlaps(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
     try:
         mc = _load_checker(cif_path, cif_content, primitive)
-        result = {
-            "has_atomic_overlaps": mc.has_atomic_overlaps,
-            "overlapping_indices": mc.get_overlapping_indices(),
-        }
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(_collect(mc, _OVERLAP_KEYS, fields))
     except Exception as exc:
         return _err("check_atomic_overlaps", exc)
 
@@ -234,10 +566,11 @@ def check_atomic_overlaps(
 
 
 @mcp.tool()
-def check_coordination(
+async def check_coordination(
     cif_path: Optional[str] = None,
     cif_content: Optional[str] = None,
     primitive: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """Check coordination chemistry of a MOF structure.
 
@@ -249,35 +582,20 @@ def check_coordination(
         cif_path: Absolute path to the CIF file.
         cif_content: Raw CIF file text content.
         primitive: If True, use the primitive cell.
+        fields: Optional subset of the output keys to compute. Defaults to all.
     """
+    return await asyncio.to_thread(_sync_check_coordination, cif_path, cif_content, primitive, fields)
+
+
+def _sync_check_coordination(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
     try:
         mc = _load_checker(cif_path, cif_content, primitive)
-        result = {
-            "has_overcoordinated_c": mc.has_overcoordinated_c,
-            "overcoordinated_c_indices": mc.overvalent_c_indices,
-            "has_overcoordinated_n": mc.has_overcoordinated_n,
-            "has_overcoordinated_h": mc.has_overcoordinated_h,
-            "overcoordinated_h_indices": mc.overvalent_h_indices,
-            "has_undercoordinated_c": mc.has_undercoordinated_c,
-            "undercoordinated_c_indices": mc.undercoordinated_c_indices,
-            "undercoordinated_c_candidate_positions": (
-                _safe_list(mc.undercoordinated_c_candidate_positions)
-                if mc.has_undercoordinated_c
-                else []
-            ),
-            "has_undercoordinated_n": mc.has_undercoordinated_n,
-            "undercoordinated_n_indices": mc.undercoordinated_n_indices,
-            "undercoordinated_n_candidate_positions": (
-                _safe_list(mc.undercoordinated_n_candidate_positions)
-                if mc.has_undercoordinated_n
-                else []
-            ),
-            "has_undercoordinated_rare_earth": mc.has_undercoordinated_rare_earth,
-            "undercoordinated_rare_earth_indices": mc.undercoordinated_rare_earth_indices,
-            "has_undercoordinated_alkali_alkaline": mc.has_undercoordinated_alkali_alkaline,
-            "has_geometrically_exposed_metal": mc.has_geometrically_exposed_metal,
-        }
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(_collect(mc, _COORDINATION_KEYS, fields))
     except Exception as exc:
         return _err("check_coordination", exc)
 
@@ -288,10 +606,11 @@ def check_coordination(
 
 
 @mcp.tool()
-def check_geometry(
+async def check_geometry(
     cif_path: Optional[str] = None,
     cif_content: Optional[str] = None,
     primitive: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """Check geometric issues in a MOF structure.
 
@@ -302,16 +621,20 @@ def check_geometry(
         cif_path: Absolute path to the CIF file.
         cif_content: Raw CIF file text content.
         primitive: If True, use the primitive cell.
+        fields: Optional subset of the output keys to compute. Defaults to all.
     """
+    return await asyncio.to_thread(_sync_check_geometry, cif_path, cif_content, primitive, fields)
+
+
+def _sync_check_geometry(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
     try:
         mc = _load_checker(cif_path, cif_content, primitive)
-        result = {
-            "has_suspicious_terminal_oxo": mc.has_suspicicious_terminal_oxo,
-            "suspicious_terminal_oxo_indices": mc.suspicicious_terminal_oxo_indices,
-            "has_lone_molecule": mc.has_lone_molecule,
-            "lone_molecule_indices": mc.lone_molecule_indices,
-        }
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(_collect(mc, _GEOMETRY_KEYS, fields))
     except Exception as exc:
         return _err("check_geometry", exc)
 
@@ -322,10 +645,11 @@ def check_geometry(
 
 
 @mcp.tool()
-def check_charges(
+async def check_charges(
     cif_path: Optional[str] = None,
     cif_content: Optional[str] = None,
     primitive: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """Check for unreasonably high EqEq partial charges.
 
@@ -336,13 +660,20 @@ def check_charges(
         cif_path: Absolute path to the CIF file.
         cif_content: Raw CIF file text content.
         primitive: If True, use the primitive cell.
+        fields: Optional subset of the output keys to compute. Defaults to all.
     """
+    return await asyncio.to_thread(_sync_check_charges, cif_path, cif_content, primitive, fields)
+
+
+def _sync_check_charges(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
     try:
         mc = _load_checker(cif_path, cif_content, primitive)
-        result = {
-            "has_high_charges": mc.has_high_charges,
-        }
-        return json.dumps(result, ensure_ascii=False)
+        return _dumps(_collect(mc, _CHARGE_KEYS, fields))
     except Exception as exc:
         return _err("check_charges", exc)
 
@@ -352,11 +683,42 @@ def check_charges(
 # ---------------------------------------------------------------------------
 
 
+# Index / detail fields of check_mof_full that are not in DESCRIPTORS.
+_EXTRA_FIELDS = {
+    "overlapping_indices": _overlapping_indices,
+    "overcoordinated_c_indices": "overvalent_c_indices",
+    "overcoordinated_h_indices": "overvalent_h_indices",
+    "undercoordinated_c_indices": "undercoordinated_c_indices",
+    "undercoordinated_c_candidate_positions": _uc_c_positions,
+    "undercoordinated_n_indices": "undercoordinated_n_indices",
+    "undercoordinated_n_candidate_positions": _uc_n_positions,
+    "undercoordinated_rare_earth_indices": "undercoordinated_rare_earth_indices",
+    "suspicious_terminal_oxo_indices": "suspicicious_terminal_oxo_indices",
+    "lone_molecule_indices": "lone_molecule_indices",
+    "spacegroup_symbol": "spacegroup_symbol",
+    "spacegroup_number": "spacegroup_number",
+}
+
+
+def _select_fields(fields: Optional[list]) -> list:
+    """Validate a requested check_mof_full field subset (all fields if empty)."""
+    if not fields:
+        return list(_DESCRIPTORS) + list(_EXTRA_FIELDS)
+    unknown = [f for f in fields if f not in _EXTRA_FIELDS and f not in _DESCRIPTORS]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s) {unknown}. Valid fields are the names returned by "
+            f"list_available_descriptors and {list(_EXTRA_FIELDS)}."
+        )
+    return list(dict.fromkeys(fields))
+
+
 @mcp.tool()
-def check_mof_full(
+async def check_mof_full(
     cif_path: Optional[str] = None,
     cif_content: Optional[str] = None,
     primitive: bool = False,
+    fields: Optional[list[str]] = None,
 ) -> str:
     """Run the complete MOFChecker suite in a single call.
 
@@ -370,49 +732,100 @@ def check_mof_full(
         cif_path: Absolute path to the CIF file.
         cif_content: Raw CIF file text content.
         primitive: If True, use the primitive cell.
+        fields: Optional subset of output keys (descriptor names or index fields
+            such as 'overlapping_indices') to compute. Checks that none of the
+            requested fields depend on are skipped. Defaults to all fields.
     """
-    try:
-        mc = _load_checker(cif_path, cif_content, primitive)
+    return await asyncio.to_thread(_sync_check_mof_full, cif_path, cif_content, primitive, fields)
 
-        # Core descriptors
-        result: dict = dict(mc.get_mof_descriptors())
-
-        # Extra index / detail fields not in DESCRIPTORS
-        result["overlapping_indices"] = mc.get_overlapping_indices()
-        result["overcoordinated_c_indices"] = mc.overvalent_c_indices
-        result["overcoordinated_h_indices"] = mc.overvalent_h_indices
-        result["undercoordinated_c_indices"] = mc.undercoordinated_c_indices
-        result["undercoordinated_c_candidate_positions"] = (
-            _safe_list(mc.undercoordinated_c_candidate_positions)
-            if mc.has_undercoordinated_c
-            else []
-        )
-        result["undercoordinated_n_indices"] = mc.undercoordinated_n_indices
-        result["undercoordinated_n_candidate_positions"] = (
-            _safe_list(mc.undercoordinated_n_candidate_positions)
-            if mc.has_undercoordinated_n
-            else []
-        )
-        result["undercoordinated_rare_earth_indices"] = mc.undercoordinated_rare_earth_indices
-        result["suspicious_terminal_oxo_indices"] = mc.suspicicious_terminal_oxo_indices
-        result["lone_molecule_indices"] = mc.lone_molecule_indices
-        result["spacegroup_symbol"] = mc.spacegroup_symbol
-        result["spacegroup_number"] = mc.spacegroup_number
-
-        # Ensure every value is JSON-serialisable
-        serializable = {}
-        for k, v in result.items():
-            try:
-                json.dumps(v)
-                serializable[k] = v
-            except (TypeError, ValueError):
-                serializable[k] = str(v)
 
-        return json.dumps(serializable, ensure_ascii=False)
+def _sync_check_mof_full(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
+    try:
+        return _dumps(_full_result(cif_path, cif_content, primitive, _select_fields(fields)))
     except Exception as exc:
         return _err("check_mof_full", exc)
 
 
+def _full_result(
+    cif_path: Optional[str],
+    cif_content: Optional[str],
+    primitive: bool,
+    selected: list,
+) -> dict:
+    """Compute the (JSON-ready) check_mof_full result for the selected fields."""
+    mc = _load_checker(cif_path, cif_content, primitive)
+
+    # Core descriptors (get_mof_descriptors builds a fresh dict, no copy needed)
+    result = mc.get_mof_descriptors([f for f in selected if f not in _EXTRA_FIELDS])
+
+    # Extra index / detail fields not in DESCRIPTORS
+    result.update(_collect(mc, tuple((key, _EXTRA_FIELDS[key]) for key in selected if key in _EXTRA_FIELDS)))
+
+    return {k: _coerce(v) for k, v in result.items()}
+
+
+# ---------------------------------------------------------------------------
+# Tool 9 — batch of CIF files (process pool)
+# ---------------------------------------------------------------------------
+
+
+def _worker_full(cif_path: str, primitive: bool, selected: list) -> dict:
+    """Run check_mof_full on one file; module-level so it can be pickled."""
+    try:
+        return _full_result(cif_path, None, primitive, selected)
+    except Exception as exc:
+        payload = _err_payload("check_mof_batch", exc)
+        payload["cif_path"] = cif_path
+        return payload
+
+
+@mcp.tool()
+async def check_mof_batch(
+    cif_paths: list[str],
+    primitive: bool = False,
+    fields: Optional[list[str]] = None,
+) -> str:
+    """Run check_mof_full on many CIF files in parallel worker processes.
+
+    Returns a JSON object with key 'results': one entry per input path, in
+    input order. A file that fails to load or check gets an entry with
+    'error', 'error_type' and 'cif_path' instead of aborting the batch.
+
+    Args:
+        cif_paths: Absolute paths to the CIF files.
+        primitive: If True, use the primitive cells.
+        fields: Optional subset of output keys, as for check_mof_full.
+    """
+    return await asyncio.to_thread(_sync_check_mof_batch, cif_paths, primitive, fields)
+
+
+def _sync_check_mof_batch(
+    cif_paths: list[str],
+    primitive: bool,
+    fields: Optional[list[str]],
+) -> str:
+    try:
+        selected = _select_fields(fields)
+        if len(cif_paths) <= 1:
+            results = [_worker_full(path, primitive, selected) for path in cif_paths]
+        else:
+            # spawn rather than fork: the server already runs threads (import
+            # warm-up, asyncio.to_thread workers) that a forked child could deadlock on.
+            workers = min(len(cif_paths), os.cpu_count() or 1)
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                n = len(cif_paths)
+                results = list(pool.map(_worker_full, cif_paths, [primitive] * n, [selected] * n))
+        return _dumps({"results": results})
+    except Exception as exc:
+        return _err("check_mof_batch", exc)
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
@@ -420,6 +833,9 @@ def check_mof_full(
 
 def main() -> None:
     """Start the MCP server using stdio transport (called by mofchecker-mcp)."""
+    # Pay the pymatgen/ase import cost while the client is still idle after
+    # the handshake, rather than on its first tool call.
+    threading.Thread(target=_lazy_import, name="mofchecker-warmup", daemon=True).start()
     mcp.run(transport="stdio")
 
 
@@ -3,7 +3,9 @@
 import functools
 import json
 import pickle
+import threading
 import warnings
+import weakref
 from types import FunctionType
 
 import pymatgen
@@ -39,6 +41,44 @@ def deprecated(func: FunctionType) -> FunctionType:
     return new_func
 
 
+class instance_cached_property:  # noqa: N801
+    """Like :func:`functools.cached_property`, but locking per instance.
+
+    Before Python 3.12, ``functools.cached_property`` serialises the first
+    access to a property across *all* instances of a class with a single
+    lock. Checks on unrelated structures running in different threads then
+    wait for each other (e.g. for a slow EqEq charge calculation). This
+    variant only locks the instance whose value is being computed. The locks
+    are kept by the descriptor, not on the instance, so instances can still
+    be pickled and copied.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = None
+        self.__doc__ = func.__doc__
+        self._locks = weakref.WeakKeyDictionary()
+        self._locks_lock = threading.Lock()
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        if self.attrname in cache:
+            return cache[self.attrname]
+        with self._locks_lock:
+            lock = self._locks.setdefault(instance, threading.Lock())
+        with lock:
+            if self.attrname not in cache:
+                cache[self.attrname] = self.func(instance)
+        with self._locks_lock:
+            self._locks.pop(instance, None)
+        return cache[self.attrname]
+
+
 def read_pickle(file: PathType):
     """Read a pickle file."""
     with open(file, "rb") as handle:
@@ -7,6 +7,7 @@ Run directly (no MCP client needed — imports tools in-process):
 The script calls tools the same way MCP would, and prints pass/fail for each.
 """
 
+import asyncio
 import json
 import sys
 import traceback
@@ -66,7 +67,7 @@ def run():
     # --- basic info ---
     print("2) get_basic_info")
     try:
-        r = get_basic_info(cif_path=CIF_PATH)
+        r = asyncio.run(get_basic_info(cif_path=CIF_PATH))
         check("get_basic_info", r, ["name", "formula", "density", "graph_hash"])
     except Exception:
         print(f"  FAIL  get_basic_info: {traceback.format_exc()}")
@@ -75,7 +76,7 @@ def run():
     # --- global structure ---
     print("3) check_global_structure")
     try:
-        r = check_global_structure(cif_path=CIF_PATH)
+        r = asyncio.run(check_global_structure(cif_path=CIF_PATH))
         check("check_global_structure", r, ["has_metal", "has_carbon", "has_3d_connected_graph"])
     except Exception:
         print(f"  FAIL  check_global_structure: {traceback.format_exc()}")
@@ -84,7 +85,7 @@ def run():
     # --- overlaps ---
     print("4) check_atomic_overlaps")
     try:
-        r = check_atomic_overlaps(cif_path=CIF_PATH)
+        r = asyncio.run(check_atomic_overlaps(cif_path=CIF_PATH))
         check("check_atomic_overlaps", r, ["has_atomic_overlaps", "overlapping_indices"])
     except Exception:
         print(f"  FAIL  check_atomic_overlaps: {traceback.format_exc()}")
@@ -93,7 +94,7 @@ def run():
     # --- coordination ---
     print("5) check_coordination")
     try:
-        r = check_coordination(cif_path=CIF_PATH)
+        r = asyncio.run(check_coordination(cif_path=CIF_PATH))
         check("check_coordination", r, ["has_overcoordinated_c", "has_undercoordinated_c"])
     except Exception:
         print(f"  FAIL  check_coordination: {traceback.format_exc()}")
@@ -102,7 +103,7 @@ def run():
     # --- geometry ---
     print("6) check_geometry")
     try:
-        r = check_geometry(cif_path=CIF_PATH)
+        r = asyncio.run(check_geometry(cif_path=CIF_PATH))
         check("check_geometry", r, ["has_lone_molecule", "has_suspicious_terminal_oxo"])
     except Exception:
         print(f"  FAIL  check_geometry: {traceback.format_exc()}")
@@ -111,7 +112,7 @@ def run():
     # --- charges (slow ~10s) ---
     print("7) check_charges  [slow, ~10 s]")
     try:
-        r = check_charges(cif_path=CIF_PATH)
+        r = asyncio.run(check_charges(cif_path=CIF_PATH))
         check("check_charges", r, ["has_high_charges"])
     except Exception:
         print(f"  FAIL  check_charges: {traceback.format_exc()}")
@@ -120,7 +121,7 @@ def run():
     # --- full check ---
     print("8) check_mof_full  [slow]")
     try:
-        r = check_mof_full(cif_path=CIF_PATH)
+        r = asyncio.run(check_mof_full(cif_path=CIF_PATH))
         check("check_mof_full", r, ["has_metal", "has_atomic_overlaps", "formula"])
     except Exception:
         print(f"  FAIL  check_mof_full: {traceback.format_exc()}")
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 """Tests for the MOFChecker MCP server tools."""
+import asyncio
 import json
 import os
+import subprocess
+import sys
 
 import pytest
 
@@ -44,6 +47,18 @@ def test_list_available_descriptors():
         assert key in result["descriptors"], f"Expected '{key}' in descriptors"
 
 
+def test_list_available_descriptors_skips_heavy_imports():
+    code = (
+        "import sys\n"
+        "from mofchecker.mcp_server import list_available_descriptors\n"
+        "list_available_descriptors()\n"
+        "assert 'mofchecker.checker' not in sys.modules\n"
+        "assert 'pymatgen' not in sys.modules\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "MOFCHECKER_EAGER_IMPORT"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
 # ---------------------------------------------------------------------------
 # Tool 2 — get_basic_info
 # ---------------------------------------------------------------------------
@@ -52,7 +67,7 @@ def test_list_available_descriptors():
 def test_get_basic_info_from_path():
     from mofchecker.mcp_server import get_basic_info
 
-    result = load(get_basic_info(cif_path=PADDLEWHEEL_CIF))
+    result = load(asyncio.run(get_basic_info(cif_path=PADDLEWHEEL_CIF)))
     assert result["formula"] is not None
     assert isinstance(result["density"], float)
     assert isinstance(result["volume"], float)
@@ -67,7 +82,7 @@ def test_get_basic_info_from_content():
 
     with open(PADDLEWHEEL_CIF, encoding="utf-8") as f:
         content = f.read()
-    result = load(get_basic_info(cif_content=content))
+    result = load(asyncio.run(get_basic_info(cif_content=content)))
     assert result["formula"] is not None
     assert isinstance(result["density"], float)
 
@@ -75,15 +90,23 @@ def test_get_basic_info_from_content():
 def test_get_basic_info_error_no_input():
     from mofchecker.mcp_server import get_basic_info
 
-    data = json.loads(get_basic_info())
+    data = json.loads(asyncio.run(get_basic_info()))
     assert "error" in data
 
 
 def test_get_basic_info_error_bad_path():
     from mofchecker.mcp_server import get_basic_info
 
-    data = json.loads(get_basic_info(cif_path="/nonexistent/path/to/file.cif"))
+    data = json.loads(asyncio.run(get_basic_info(cif_path="/nonexistent/path/to/file.cif")))
     assert "error" in data
+    assert data["error_type"] == "FileNotFoundError"
+
+
+def test_get_basic_info_error_blank_content():
+    from mofchecker.mcp_server import get_basic_info
+
+    data = json.loads(asyncio.run(get_basic_info(cif_content="  \n")))
+    assert data["error_type"] == "ValueError"
 
 
 # ---------------------------------------------------------------------------
@@ -94,17 +117,27 @@ def test_get_basic_info_error_bad_path():
 def test_check_global_structure_mof5():
     from mofchecker.mcp_server import check_global_structure
 
-    result = load(check_global_structure(cif_path=MOF5_CIF))
+    result = load(asyncio.run(check_global_structure(cif_path=MOF5_CIF)))
     assert result["has_metal"] is True
     assert result["has_carbon"] is True
     assert result["has_hydrogen"] is True
     assert result["has_3d_connected_graph"] is True
 
 
+def test_check_global_structure_fields_subset():
+    from mofchecker.mcp_server import check_global_structure
+
+    result = load(asyncio.run(check_global_structure(cif_path=MOF5_CIF, fields=["has_metal"])))
+    assert result == {"has_metal": True}
+
+    data = json.loads(asyncio.run(check_global_structure(cif_path=MOF5_CIF, fields=["formula"])))
+    assert data["error_type"] == "ValueError"
+
+
 def test_check_global_structure_paddlewheel():
     from mofchecker.mcp_server import check_global_structure
 
-    result = load(check_global_structure(cif_path=PADDLEWHEEL_CIF))
+    result = load(asyncio.run(check_global_structure(cif_path=PADDLEWHEEL_CIF)))
     assert result["has_metal"] is True
 
 
@@ -116,7 +149,7 @@ def test_check_global_structure_paddlewheel():
 def test_check_atomic_overlaps_clean():
     from mofchecker.mcp_server import check_atomic_overlaps
 
-    result = load(check_atomic_overlaps(cif_path=PADDLEWHEEL_CIF))
+    result = load(asyncio.run(check_atomic_overlaps(cif_path=PADDLEWHEEL_CIF)))
     assert "has_atomic_overlaps" in result
     assert isinstance(result["overlapping_indices"], list)
 
@@ -124,7 +157,7 @@ def test_check_atomic_overlaps_clean():
 def test_check_atomic_overlaps_with_overlaps():
     from mofchecker.mcp_server import check_atomic_overlaps
 
-    result = load(check_atomic_overlaps(cif_path=OVERLAP_CIF))
+    result = load(asyncio.run(check_atomic_overlaps(cif_path=OVERLAP_CIF)))
     assert result["has_atomic_overlaps"] is True
     assert len(result["overlapping_indices"]) > 0
 
@@ -137,7 +170,7 @@ def test_check_atomic_overlaps_with_overlaps():
 def test_check_coordination_keys():
     from mofchecker.mcp_server import check_coordination
 
-    result = load(check_coordination(cif_path=PADDLEWHEEL_CIF))
+    result = load(asyncio.run(check_coordination(cif_path=PADDLEWHEEL_CIF)))
     expected_keys = [
         "has_overcoordinated_c",
         "has_overcoordinated_n",
@@ -158,7 +191,7 @@ def test_check_coordination_keys():
 def test_check_coordination_missing_h():
     from mofchecker.mcp_server import check_coordination
 
-    result = load(check_coordination(cif_path=MISSING_H_CIF))
+    result = load(asyncio.run(check_coordination(cif_path=MISSING_H_CIF)))
     assert result["has_undercoordinated_c"] is True
     assert len(result["undercoordinated_c_indices"]) > 0
     # Candidate positions should be a list of [x, y, z] lists
@@ -177,7 +210,7 @@ def test_check_coordination_missing_h():
 def test_check_geometry_keys():
     from mofchecker.mcp_server import check_geometry
 
-    result = load(check_geometry(cif_path=PADDLEWHEEL_CIF))
+    result = load(asyncio.run(check_geometry(cif_path=PADDLEWHEEL_CIF)))
     assert "has_suspicious_terminal_oxo" in result
     assert "suspicious_terminal_oxo_indices" in result
     assert "has_lone_molecule" in result
@@ -187,7 +220,7 @@ def test_check_geometry_keys():
 def test_check_geometry_floating():
     from mofchecker.mcp_server import check_geometry
 
-    result = load(check_geometry(cif_path=FLOATING_CIF))
+    result = load(asyncio.run(check_geometry(cif_path=FLOATING_CIF)))
     assert result["has_lone_molecule"] is True
     assert len(result["lone_molecule_indices"]) > 0
 
@@ -200,7 +233,7 @@ def test_check_geometry_floating():
 def test_check_charges_keys():
     from mofchecker.mcp_server import check_charges
 
-    result = load(check_charges(cif_path=PADDLEWHEEL_CIF))
+    result = load(asyncio.run(check_charges(cif_path=PADDLEWHEEL_CIF)))
     assert "has_high_charges" in result
     # Value should be bool or None
     assert result["has_high_charges"] in (True, False, None)
@@ -214,7 +247,7 @@ def test_check_charges_keys():
 def test_check_mof_full_keys():
     from mofchecker.mcp_server import check_mof_full
 
-    result = load(check_mof_full(cif_path=PADDLEWHEEL_CIF))
+    result = load(asyncio.run(check_mof_full(cif_path=PADDLEWHEEL_CIF)))
     # All standard descriptors must be present (except is_porous)
     from mofchecker import DESCRIPTORS
 
@@ -240,15 +273,144 @@ def test_check_mof_full_keys():
 def test_check_mof_full_mof5():
     from mofchecker.mcp_server import check_mof_full
 
-    result = load(check_mof_full(cif_path=MOF5_CIF))
+    result = load(asyncio.run(check_mof_full(cif_path=MOF5_CIF)))
     assert result["has_metal"] is True
     assert result["has_carbon"] is True
     assert result["has_atomic_overlaps"] is False
 
 
+def test_check_mof_full_fields_subset():
+    from mofchecker.mcp_server import check_mof_full
+
+    fields = ["formula", "has_metal", "overlapping_indices"]
+    result = load(asyncio.run(check_mof_full(cif_path=MOF5_CIF, fields=fields)))
+    assert list(result) == fields
+    assert result["has_metal"] is True
+
+
+def test_check_mof_full_unknown_field():
+    from mofchecker.mcp_server import check_mof_full
+
+    data = json.loads(asyncio.run(check_mof_full(cif_path=MOF5_CIF, fields=["no_such_field"])))
+    assert "error" in data
+    assert "no_such_field" in data["error"]
+
+
 def test_check_mof_full_error():
     from mofchecker.mcp_server import check_mof_full
 
-    data = json.loads(check_mof_full(cif_path="/no/such/file.cif"))
+    data = json.loads(asyncio.run(check_mof_full(cif_path="/no/such/file.cif")))
     assert "error" in data
     assert data["tool"] == "check_mof_full"
+    assert data["error_type"] == "FileNotFoundError"
+
+
+# ---------------------------------------------------------------------------
+# Tool 9 — check_mof_batch
+# ---------------------------------------------------------------------------
+
+
+def test_check_mof_batch():
+    from mofchecker.mcp_server import check_mof_batch
+
+    paths = [MOF5_CIF, "/no/such/file.cif", PADDLEWHEEL_CIF]
+    results = load(asyncio.run(check_mof_batch(cif_paths=paths, fields=["formula", "has_metal"])))["results"]
+    assert len(results) == 3
+    assert results[0]["has_metal"] is True
+    assert results[1]["cif_path"] == "/no/such/file.cif"
+    assert "error" in results[1]
+    assert set(results[2]) == {"formula", "has_metal"}
+
+
+# ---------------------------------------------------------------------------
+# Checker cache
+# ---------------------------------------------------------------------------
+
+
+def test_load_checker_is_cached_by_path():
+    from mofchecker.mcp_server import _load_checker
+
+    first = _load_checker(PADDLEWHEEL_CIF, None)
+    assert _load_checker(PADDLEWHEEL_CIF, None) is first
+    assert _load_checker(PADDLEWHEEL_CIF, None, primitive=True) is not first
+
+
+def test_load_checker_is_cached_by_content():
+    from mofchecker.mcp_server import _load_checker
+
+    with open(PADDLEWHEEL_CIF, encoding="utf-8") as f:
+        content = f.read()
+    assert _load_checker(None, content) is _load_checker(None, content)
+
+
+def test_lru_cache_computes_concurrent_misses_once():
+    import threading
+    import time
+
+    from mofchecker.mcp_server import _LRUCache
+
+    cache = _LRUCache(maxsize=2)
+    calls = []
+
+    def compute():
+        calls.append(None)
+        time.sleep(0.2)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    cache.get_or_compute("a", object)
+    cache.get_or_compute("b", object)
+    assert len(cache) == 2
+
+
+def test_memo_checker_reuses_property_values():
+    from mofchecker.mcp_server import _load_checker
+
+    mc = _load_checker(PADDLEWHEEL_CIF, None)
+    assert mc.graph_hash is mc.graph_hash
+    assert mc.get_overlapping_indices() is mc.get_overlapping_indices()
+    assert list(mc.get_mof_descriptors(["formula", "has_metal"])) == ["formula", "has_metal"]
+
+
+def test_coerce_converts_numpy_values():
+    import numpy as np
+
+    from mofchecker.mcp_server import _coerce
+
+    value = {"flag": np.bool_(True), "positions": (np.zeros(3), [np.int64(2)]), "other": object}
+    coerced = _coerce(value)
+    assert coerced["flag"] is True
+    assert coerced["positions"] == [[0.0, 0.0, 0.0], [2]]
+    assert isinstance(coerced["other"], str)
+    json.dumps(coerced)
+
+
+def test_charge_result_shared_between_path_and_content():
+    from mofchecker import mcp_server
+
+    first = load(asyncio.run(mcp_server.check_charges(cif_path=PADDLEWHEEL_CIF)))
+    n_cached = len(mcp_server._CHARGE_CACHE)
+    with open(PADDLEWHEEL_CIF, encoding="utf-8") as f:
+        content = f.read()
+    second = load(asyncio.run(mcp_server.check_charges(cif_content=content)))
+    assert second == first
+    assert len(mcp_server._CHARGE_CACHE) == n_cached
+
+
+def test_charge_cache_key_tracks_geometry():
+    from pymatgen.core import Structure
+
+    from mofchecker.mcp_server import _structure_digest
+
+    structure = Structure.from_file(PADDLEWHEEL_CIF)
+    displaced = structure.copy()
+    displaced.translate_sites([0], [0.0, 0.0, 0.05], frac_coords=False)
+    assert _structure_digest(structure) == _structure_digest(structure.copy())
+    assert _structure_digest(structure) != _structure_digest(displaced)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Tests for the helper functions."""
+import copy
+import pickle
+import threading
+import time
+
+from mofchecker.checks.check_base import AbstractCheck
+from mofchecker.utils import instance_cached_property
+
+
+class _Slow:
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+
+    @instance_cached_property
+    def value(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.delay
+
+
+def test_instance_cached_property_caches_per_instance():
+    obj = _Slow(0)
+    assert obj.value == 0
+    assert obj.value == 0
+    assert obj.calls == 1
+
+
+def test_instance_cached_property_does_not_block_other_instances():
+    slow, fast = _Slow(1.0), _Slow(0)
+    thread = threading.Thread(target=lambda: slow.value)
+    thread.start()
+    time.sleep(0.05)
+    start = time.perf_counter()
+    assert fast.value == 0
+    assert time.perf_counter() - start < 0.5
+    thread.join()
+
+
+def test_instance_cached_property_computes_once_under_contention():
+    obj = _Slow(0.2)
+    threads = [threading.Thread(target=lambda: obj.value) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert obj.calls == 1
+
+
+class _Check(AbstractCheck):
+    description = "Test check."
+    name = "test"
+
+    def _run_check(self):
+        return True
+
+
+def test_check_pickles_after_is_ok():
+    check = _Check()
+    assert check.is_ok
+    for clone in (pickle.loads(pickle.dumps(check)), copy.deepcopy(check)):
+        assert clone.is_ok
+        assert clone.__dict__ == {"is_ok": True}